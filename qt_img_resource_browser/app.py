@@ -36,7 +36,8 @@ class QtImgResourceData(object):
     ``dict_as_sorted_list()``
 
     Attributes:
-        data_dict (dict): this dictionary holds the information about the image resources
+        data_dict (dict): this dictionary holds the information about the image resources, keyed by image name,
+            or by directory and name for images under one of the ``path_exclusions``
 
     Class Attributes:
         config_json (str): string path to the configuration json file
@@ -51,7 +52,7 @@ class QtImgResourceData(object):
 
     def __init__(self):
         self.data_dict = OrderedDefaultDict(lambda: {"img_path": "",
-                                                     # "img_name": "",
+                                                     "img_name": "",
                                                      "img_ext": "",
                                                      "addl_sizes": []})
 
@@ -67,9 +68,28 @@ class QtImgResourceData(object):
         else:
             log.critical("Could not load the config.json file!")
 
-    def _generator_find_images(self, valid_ext_list=None):
+        # what each resource root added to ``data_dict`` and the options it was scanned with, used by ``refresh()``
+        # several roots can provide the same image and size, so each pair is counted
+        self.root_entries = {}
+        self.size_counts = defaultdict(int)
+        self.key_roots = defaultdict(set)
+        self.scan_options = (None, True)
+
+    def _resource_roots(self):
         """
-        Iterate over the ":" path.  In Qt this is the loaded resources path
+        list the top level entries of the ":" path, every registered resource bundle adds its
+        files and directories under one or more of these roots
+
+        Returns:
+            set[str]: the root paths, such as ":/fileOpen.png" or ":/icons"
+        """
+        root_dir = QtCore.QDir(":")
+        return set(":/{}".format(name)
+                   for name in root_dir.entryList(QtCore.QDir.AllEntries | QtCore.QDir.NoDotAndDotDot))
+
+    def _generator_find_images(self, valid_ext_list=None, apply_exclusions=True, root=":"):
+        """
+        Iterate over the ``root`` path.  In Qt ":" is the loaded resources path
         when an item is found that matches the ``valid_ext_list`` it is yielded
 
         Notes:
@@ -78,6 +98,8 @@ class QtImgResourceData(object):
         Args:
             valid_ext_list (list[str]): a list of valid extension strings, must start with a "." as in ".png".
             this is an optional argument, if no list is provided, the default list is loaded from the configuration file
+            apply_exclusions (bool): skip paths starting with any of the configured ``path_exclusions``
+            root (str): the resource directory or file to search, defaults to every loaded resource
 
         Yields:
             str: the next found path string
@@ -91,50 +113,170 @@ class QtImgResourceData(object):
         if not all(x.startswith(".") for x in valid_ext_list):
             raise ValueError("all extensions in valid_ext_list must start with a '.' ")
 
-        it = QtCore.QDirIterator(":", QtCore.QDirIterator.Subdirectories)
-        while it.hasNext():
-            next_item = it.next()
+        if QtCore.QFileInfo(root).isFile():
+            found = [root]
+        else:
+            found = self._generator_iterate_dir(root)
 
-            if any(next_item.startswith(x) for x in self.config["path_exclusions"]):
+        for next_item in found:
+            if apply_exclusions and self._is_excluded(next_item):
                 continue
 
             if any(next_item.endswith(ext) for ext in valid_ext_list):
                 yield next_item
 
-    def build_img_dict(self, valid_ext_list=None):
+    def _is_excluded(self, img_path):
+        """
+        Args:
+            img_path (str): the full path to the image
+
+        Returns:
+            bool: True if the path starts with any of the configured ``path_exclusions``
+        """
+        return any(img_path.startswith(x) for x in self.config["path_exclusions"])
+
+    @staticmethod
+    def _generator_iterate_dir(root):
+        """
+        Args:
+            root (str): the resource directory to search
+
+        Yields:
+            str: every path below ``root``
+        """
+        it = QtCore.QDirIterator(root, QtCore.QDirIterator.Subdirectories)
+        while it.hasNext():
+            yield it.next()
+
+    def _add_image(self, img_path):
+        """
+        add one image path to ``data_dict``, grouping it with images that have the same name
+        except a number suffix. a suffix is only recorded once per image
+
+        excluded images are keyed by their directory and name instead of the name alone, so they
+        never merge into a visible image that happens to share the name
+
+        Args:
+            img_path (str): the full path to the image
+
+        Returns:
+            tuple[str, str]: the ``data_dict`` key the path was grouped under and its size suffix
+        """
+        img = os.path.basename(img_path)
+        img_name, img_ext = os.path.splitext(img)
+
+        # if no number suffix, add empty string
+        img_size = ""
+
+        # match ending of -000 or _000
+        search_string, __ = os.path.splitext(img_path)
+        match_list = re.split("([_-]\d+$)", search_string)
+        if len(match_list) > 1:
+            img_path = "{}{}".format(match_list[0], img_ext)
+            img_name, img_ext = os.path.splitext(os.path.basename(img_path))
+            img_size = match_list[1]
+
+        key = img_name
+        if self._is_excluded(img_path):
+            key, __ = os.path.splitext(img_path)
+
+        if img_size not in self.data_dict[key]["addl_sizes"]:
+            self.data_dict[key]["addl_sizes"].append(img_size)
+        self.data_dict[key]["img_path"] = img_path
+        self.data_dict[key]["img_name"] = img_name
+        self.data_dict[key]["img_ext"] = img_ext
+
+        return key, img_size
+
+    def _scan_root(self, root):
+        """
+        add every image below one resource root to ``data_dict`` and remember what it contributed
+
+        Args:
+            root (str): the resource root path
+
+        Returns:
+            list[tuple[str, str, str]]: the ``data_dict`` key, size suffix and full path of each image below ``root``
+        """
+        valid_ext_list, apply_exclusions = self.scan_options
+
+        entries = []
+        for img_path in self._generator_find_images(valid_ext_list, apply_exclusions, root=root):
+            key, img_size = self._add_image(img_path)
+            entries.append((key, img_size, img_path))
+            self.size_counts[(key, img_size)] += 1
+            self.key_roots[key].add(root)
+
+        self.root_entries[root] = entries
+        return entries
+
+    def _remove_root(self, root):
+        """
+        remove the size suffixes only this resource root contributed, images left without any size are removed
+        and images another root still provides are pointed back at that root's path
+
+        Args:
+            root (str): the resource root path
+
+        Returns:
+            list[tuple[str, str, str]]: the ``data_dict`` key, size suffix and full path of each image the root contributed
+        """
+        entries = self.root_entries.pop(root, [])
+        for img_name, img_size, __ in entries:
+            self.size_counts[(img_name, img_size)] -= 1
+            if self.size_counts[(img_name, img_size)] > 0:
+                continue
+            del self.size_counts[(img_name, img_size)]
+
+            if img_name not in self.data_dict:
+                continue
+
+            addl_sizes = self.data_dict[img_name]["addl_sizes"]
+            if img_size in addl_sizes:
+                addl_sizes.remove(img_size)
+            if not addl_sizes:
+                del self.data_dict[img_name]
+
+        keys = set(key for key, __, __ in entries)
+        for key in keys:
+            self.key_roots[key].discard(root)
+            if not self.key_roots[key]:
+                del self.key_roots[key]
+
+        # the removed root may have set the path and extension, take them from a surviving root again
+        for key in keys:
+            if key not in self.data_dict:
+                continue
+            for other_root in sorted(self.key_roots[key]):
+                for other_key, __, img_path in self.root_entries[other_root]:
+                    if other_key == key:
+                        self._add_image(img_path)
+
+        return entries
+
+    def build_img_dict(self, valid_ext_list=None, apply_exclusions=True):
         """
         build the data dict and update the instance variable ``data_dict``
         groups images that have the same name except a number suffix, preceded by an underscore or a dash,
         such as _123 or -45.
 
+        any previous data is replaced, use ``refresh()`` to pick up resources registered since the last build
+
         Args:
             valid_ext_list (list[str]): a list of valid extension strings provided to the generator,
                 must start with a "." as in ".png".
                 this is an optional argument, if no list is provided, the default list is [".png", ".svg"]
+            apply_exclusions (bool): skip the configured ``path_exclusions`` while scanning,
+                pass False to keep them in the data so they can be filtered later instead
         """
+        self.data_dict.clear()
+        self.root_entries = {}
+        self.size_counts.clear()
+        self.key_roots.clear()
+        self.scan_options = (valid_ext_list, apply_exclusions)
 
-        for img_path in self._generator_find_images(valid_ext_list):
-            img = os.path.basename(img_path)
-            img_name, img_ext = os.path.splitext(img)
-
-            img_sizes = []
-
-            # match ending of -000 or _000
-            search_string, __ = os.path.splitext(img_path)
-            match_list = re.split("([_-]\d+$)", search_string)
-            if len(match_list) > 1:
-                img_path = "{}{}".format(match_list[0], img_ext)
-                img_name, img_ext = os.path.splitext(os.path.basename(img_path))
-                self.data_dict[img_name]["addl_sizes"].append(match_list[1])
-                self.data_dict[img_name]["img_path"] = img_path
-                # self.data_dict[img_name]["img_name"] = img_name
-                self.data_dict[img_name]["img_ext"] = img_ext
-                img_sizes.append(match_list[1])
-            else:
-                self.data_dict[img_name]["addl_sizes"].append("")  # if no number suffix, add empty string
-                self.data_dict[img_name]["img_path"] = img_path
-                # self.data_dict[img_name]["img_name"] = img_name
-                self.data_dict[img_name]["img_ext"] = img_ext
+        for root in sorted(self._resource_roots()):
+            self._scan_root(root)
 
         log.debug("dict len: {}".format(len(self.data_dict)))
         if log.level == logging.DEBUG:
@@ -144,6 +286,37 @@ class QtImgResourceData(object):
                 print("{0:>{t}}".format(value["img_path"], t=key_len))
                 # print("{0:>{tab}}".format(value["addl_sizes"], tab=len(key)+2))
 
+    def refresh(self):
+        """
+        update ``data_dict`` for resource bundles registered or unregistered since the last build
+        only the resource roots that appeared or disappeared are scanned, using the same options
+        as the last ``build_img_dict()``
+
+        Notes:
+            a bundle that only adds files inside an already known root directory is not detected,
+            call ``build_img_dict()`` again for a full rescan
+
+        Returns:
+            tuple[list[str], list[str]]: the ``data_dict`` keys to remove and the keys to add, an image
+            whose sizes or path changed is in both lists
+        """
+        current_roots = self._resource_roots()
+        known_roots = set(self.root_entries)
+        names_before = set(self.data_dict)
+
+        touched = set()
+        for root in known_roots - current_roots:
+            touched.update(key for key, __, __ in self._remove_root(root))
+        for root in sorted(current_roots - known_roots):
+            touched.update(key for key, __, __ in self._scan_root(root))
+
+        removed = sorted(img_name for img_name in touched if img_name in names_before)
+        added = sorted(img_name for img_name in touched if img_name in self.data_dict)
+
+        log.debug("refresh removed: {} added: {}".format(len(removed), len(added)))
+
+        return removed, added
+
     def dict_as_sorted_list(self, by_path=False, by_name=False):
         """
         format the data as a list sorted by the full path or by the file name
@@ -0,0 +1,340 @@
+"""
+export module for writing an offline, searchable gallery of the image resources
+
+images are packed into paginated contact sheets (png sprite sheets), each page is rendered and saved
+by its own job on a thread pool so only a few pages are ever held in memory. a json and css index of
+the sprite positions and a static html page with client side search are written next to the sheets
+
+Examples:
+    exporter = GalleryExporter(data_list, "C:/temp/maya_icons")
+    exporter.export()
+"""
+import os
+import json
+import logging
+import threading
+
+try:
+    from PySide2 import QtCore, QtGui
+except ImportError:
+    from vendor.Qt import QtCore, QtGui
+
+from svg import svg_cache, is_svg
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.CRITICAL)
+
+SHEET_DIR = "sheets"
+SHEET_NAME = "sheet_{:04d}.png"
+
+GALLERY_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Qt Image Resource Gallery</title>
+<link rel="stylesheet" href="gallery.css">
+<style>
+body {{ background: rgb(54, 54, 54); color: rgb(200, 200, 200); font-family: sans-serif; margin: 0; }}
+#bar {{ position: sticky; top: 0; padding: 8px; background: rgb(42, 42, 42); }}
+#search {{ width: 60%; padding: 4px; font-size: 14px; }}
+#list {{ display: flex; flex-wrap: wrap; padding: 4px; }}
+.item {{ width: 150px; margin: 4px; padding: 4px; background: rgb(64, 64, 64); text-align: center; }}
+.item span {{ display: block; font-size: 11px; word-wrap: break-word; }}
+.icon {{ width: {tile}px; height: {tile}px; margin: auto; background-repeat: no-repeat; }}
+</style>
+</head>
+<body>
+<div id="bar"><input id="search" placeholder="Search" autofocus> <span id="count"></span></div>
+<div id="list"></div>
+<script src="gallery_data.js"></script>
+<script>
+var search = document.getElementById("search");
+var list = document.getElementById("list");
+var count = document.getElementById("count");
+
+// names and paths come from resource bundles, only ever set them as text, never as markup
+function addText(parent, tag, text) {{
+    var node = document.createElement(tag);
+    node.textContent = text;
+    parent.appendChild(node);
+    return node;
+}}
+
+function render() {{
+    var query = search.value.toLowerCase();
+    var items = document.createDocumentFragment();
+    var shown = 0;
+    for (var i = 0; i < GALLERY.length; i++) {{
+        var item = GALLERY[i];
+        if (query && item.path.toLowerCase().indexOf(query) < 0) {{
+            continue;
+        }}
+        var div = document.createElement("div");
+        div.className = "item";
+        div.setAttribute("title", item.path);
+
+        var icon = document.createElement("div");
+        icon.className = "icon s" + item.sheet + " i" + i;
+        div.appendChild(icon);
+
+        addText(addText(div, "span", ""), "b", item.name);
+        addText(div, "span", item.path);
+        addText(div, "span", "w: " + item.width + " h: " + item.height);
+
+        items.appendChild(div);
+        shown++;
+    }}
+    list.textContent = "";
+    list.appendChild(items);
+    count.textContent = shown + " / " + GALLERY.length;
+}}
+
+search.addEventListener("input", render);
+render();
+</script>
+</body>
+</html>
+"""
+
+
+class ContactSheetJob(QtCore.QRunnable):
+    """
+    render and save one contact sheet page on a thread pool
+
+    only QImage and QPainter are used, both are safe outside the gui thread
+
+    Args:
+        exporter (GalleryExporter): the exporter collecting the results
+        page (int): the page number
+        entries (list): the image resource tuples for this page, a name and a dictionary of data
+    """
+
+    def __init__(self, exporter, page, entries):
+        super(ContactSheetJob, self).__init__()
+
+        self.exporter = exporter
+        self.page = page
+        self.entries = entries
+
+    def run(self):
+        # an exception can't leave the pool's thread, report it so the export knows this page is missing
+        try:
+            self.exporter.page_finished(self.page, self.render_page())
+        except Exception as e:
+            self.exporter.page_failed(self.page, str(e))
+
+    def render_page(self):
+        """
+        render the page's tiles and save the contact sheet
+
+        Returns:
+            list[dict]: the index entries for the images on the page
+        """
+        exporter = self.exporter
+        tile = exporter.tile_size
+        cell = exporter.cell_size
+
+        rows = (len(self.entries) + exporter.columns - 1) // exporter.columns
+        sheet = QtGui.QImage(exporter.columns * cell, rows * cell, QtGui.QImage.Format_ARGB32_Premultiplied)
+        sheet.fill(QtCore.Qt.transparent)
+
+        index = []
+        painter = QtGui.QPainter(sheet)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        try:
+            for i, (name, data) in enumerate(self.entries):
+                image, img_size = exporter.load_tile(data["img_path"])
+
+                x = (i % exporter.columns) * cell
+                y = (i // exporter.columns) * cell
+                painter.drawImage(QtCore.QPointF(x + (tile - image.width()) / 2.0,
+                                                 y + (tile - image.height()) / 2.0),
+                                  image)
+
+                index.append({"name": data["img_name"],
+                              "path": data["img_path"],
+                              "ext": data["img_ext"],
+                              "addl_sizes": data["addl_sizes"],
+                              "width": img_size.width(),
+                              "height": img_size.height(),
+                              "sheet": self.page,
+                              "x": x,
+                              "y": y})
+        finally:
+            painter.end()
+
+        sheet_path = os.path.join(exporter.output_dir, SHEET_DIR, SHEET_NAME.format(self.page))
+        if not sheet.save(sheet_path):
+            raise IOError("Could not save {}".format(sheet_path))
+
+        return index
+
+
+class GalleryExporter(object):
+    """
+    export image resources as contact sheets with a json, css and html index
+
+    Args:
+        data_list (list): a list of image resource tuples, a name and a dictionary of data
+        output_dir (str): the directory to write the gallery to, it is created if needed
+
+    Class Attributes:
+        tile_size (int): the largest width or height of an image on a contact sheet
+        padding (int): the space between tiles on a contact sheet
+        columns (int): the number of tiles in one contact sheet row
+        rows_per_page (int): the number of tile rows on one contact sheet
+    """
+
+    tile_size = 64
+    padding = 8
+    columns = 16
+    rows_per_page = 16
+
+    def __init__(self, data_list, output_dir):
+        self.data_list = data_list
+        self.output_dir = output_dir
+
+        self.pages = {}
+        self.failed_pages = {}
+        self.lock = threading.Lock()
+
+        self.pool = QtCore.QThreadPool()
+        self.pool.setMaxThreadCount(max(QtCore.QThread.idealThreadCount(), 1))
+
+    @property
+    def cell_size(self):
+        """
+        Returns:
+            int: the size of one tile including padding
+        """
+        return self.tile_size + self.padding
+
+    @property
+    def page_size(self):
+        """
+        Returns:
+            int: the number of images on one contact sheet
+        """
+        return self.columns * self.rows_per_page
+
+    @property
+    def num_pages(self):
+        """
+        Returns:
+            int: the number of contact sheets needed for ``data_list``
+        """
+        return (len(self.data_list) + self.page_size - 1) // self.page_size
+
+    def load_tile(self, img_path):
+        """
+        load an image scaled down to fit in ``tile_size``
+
+        Args:
+            img_path (str): the full path to the image
+
+        Returns:
+            tuple[QtGui.QImage, QtCore.QSize]: the tile image and the natural size of the image
+        """
+        # export tiles are only needed once, keep them out of the browser's svg cache
+        if is_svg(img_path):
+            return svg_cache.render(img_path, self.tile_size, cache=False)
+
+        image = QtGui.QImage(img_path)
+        img_size = image.size()
+        if image.width() > self.tile_size or image.height() > self.tile_size:
+            image = image.scaled(self.tile_size, self.tile_size,
+                                 QtCore.Qt.KeepAspectRatio,
+                                 QtCore.Qt.SmoothTransformation)
+        return image, img_size
+
+    def page_finished(self, page, index):
+        """
+        collect the index of a saved page, called from the pool's threads
+
+        Args:
+            page (int): the page number
+            index (list[dict]): the index entries for the images on the page
+        """
+        with self.lock:
+            self.pages[page] = index
+
+    def page_failed(self, page, message):
+        """
+        record a page that could not be rendered or saved, called from the pool's threads
+
+        Args:
+            page (int): the page number
+            message (str): why the page failed
+        """
+        with self.lock:
+            self.failed_pages[page] = message
+
+    def export(self, progress_callback=None):
+        """
+        render every contact sheet on the thread pool then write the index files and the html gallery
+
+        pages that fail are left out of the gallery and recorded in ``failed_pages`` with the reason
+
+        Args:
+            progress_callback (callable): optional, called on the calling thread with the number of finished pages
+
+        Returns:
+            str: the path to the html gallery
+        """
+        sheet_dir = os.path.join(self.output_dir, SHEET_DIR)
+        if not os.path.isdir(sheet_dir):
+            os.makedirs(sheet_dir)
+
+        self.pages = {}
+        self.failed_pages = {}
+        for page in range(self.num_pages):
+            start = page * self.page_size
+            self.pool.start(ContactSheetJob(self, page, self.data_list[start:start + self.page_size]))
+
+        while not self.pool.waitForDone(100):
+            if progress_callback:
+                progress_callback(len(self.pages) + len(self.failed_pages))
+
+        if progress_callback:
+            progress_callback(len(self.pages) + len(self.failed_pages))
+
+        index = []
+        for page in range(self.num_pages):
+            index.extend(self.pages.get(page, []))
+        self.pages = {}
+
+        for page, message in sorted(self.failed_pages.items()):
+            log.error("page {} failed: {}".format(page, message))
+
+        self.write_index(index)
+
+        log.debug("exported {} images on {} sheets".format(len(index), self.num_pages))
+
+        return os.path.join(self.output_dir, "index.html")
+
+    def write_index(self, index):
+        """
+        write the json index, the css sprite positions and the html gallery
+
+        Args:
+            index (list[dict]): the index entries for every image in catalog order
+        """
+        with open(os.path.join(self.output_dir, "index.json"), "w") as json_file:
+            json.dump(index, json_file, indent=1)
+
+        # html loaded from disk can't request json, so the gallery reads the same data from a script
+        with open(os.path.join(self.output_dir, "gallery_data.js"), "w") as js_file:
+            js_file.write("var GALLERY = ")
+            json.dump(index, js_file)
+            js_file.write(";\n")
+
+        with open(os.path.join(self.output_dir, "gallery.css"), "w") as css_file:
+            for page in range(self.num_pages):
+                css_file.write(".s{} {{ background-image: url({}/{}); }}\n".format(page,
+                                                                                  SHEET_DIR,
+                                                                                  SHEET_NAME.format(page)))
+            for i, entry in enumerate(index):
+                css_file.write(".i{} {{ background-position: -{}px -{}px; }}\n".format(i, entry["x"], entry["y"]))
+
+        with open(os.path.join(self.output_dir, "index.html"), "w") as html_file:
+            html_file.write(GALLERY_HTML.format(tile=self.tile_size))
@@ -0,0 +1,242 @@
+"""
+facet module for narrowing the image resources by extension, pixel size, size variants,
+resource location and path exclusions
+
+every facet value is stored as a bitset over catalog indices so combining facets, or combining
+them with the text search, is only a handful of integer operations no matter the catalog size
+"""
+import logging
+from collections import OrderedDict
+
+try:
+    from PySide2 import QtGui
+except ImportError:
+    from .vendor.Qt import QtGui
+
+from search import iter_bits
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.CRITICAL)
+
+EXTENSION = "Extension"
+SIZE = "Size"
+VARIANTS = "Variants"
+LOCATION = "Location"
+EXCLUDE = "Exclude"
+
+HAS_VARIANTS = "Has Size Variants"
+ROOT_LOCATION = "(root)"
+UNKNOWN_SIZE = "Unknown"
+
+
+def image_size(img_path):
+    """
+    read the pixel size of an image from its header without decoding it
+
+    Args:
+        img_path (str): the full path to the image
+
+    Returns:
+        tuple[int, int]: the width and height, both are -1 if the size can't be read
+    """
+    size = QtGui.QImageReader(img_path).size()
+    return size.width(), size.height()
+
+
+def top_level_location(img_path):
+    """
+    get the first directory of a resource path
+
+    Examples:
+        top_level_location(":/icons/fileOpen.png") -> "icons"
+        top_level_location(":/fileOpen.png") -> "(root)"
+
+    Args:
+        img_path (str): the full resource path
+
+    Returns:
+        str: the first directory name or ``ROOT_LOCATION``
+    """
+    parts = img_path.lstrip(":").lstrip("/").split("/")
+    if len(parts) > 1:
+        return parts[0]
+    return ROOT_LOCATION
+
+
+class FacetIndex(object):
+    """
+    precomputed bitsets for every facet value of the image resource catalog
+
+    values inside one facet group are combined with OR and the groups are combined with AND,
+    a group with no active values does not restrict the result. the ``EXCLUDE`` group is the
+    opposite, every item matching an active exclusion prefix is removed from the result
+
+    Args:
+        exclusions (list[str]): path prefixes offered as exclusions, they are all active by default
+
+    Class Attributes:
+        size_buckets (tuple): pairs of the largest pixel dimension and the label for that bucket,
+            a ``None`` limit catches everything larger
+
+    Examples:
+        facets = FacetIndex([":/webkit"])
+        facets.add(":/fileOpen.png", ".png", [""])
+        facets.set_active(EXTENSION, "svg", True)
+        visible = facets.mask()
+    """
+
+    size_buckets = ((16, "16px and smaller"),
+                    (32, "17 - 32px"),
+                    (64, "33 - 64px"),
+                    (None, "Larger than 64px"))
+
+    def __init__(self, exclusions=None):
+        self.size = 0
+        self.alive = 0
+
+        self.bits = OrderedDict((group, OrderedDict()) for group in (EXTENSION, SIZE, VARIANTS, LOCATION, EXCLUDE))
+        self.active = dict((group, set()) for group in self.bits)
+
+        for label in [label for __, label in self.size_buckets] + [UNKNOWN_SIZE]:
+            self.bits[SIZE][label] = 0
+        self.bits[VARIANTS][HAS_VARIANTS] = 0
+        for prefix in exclusions or []:
+            self.bits[EXCLUDE][prefix] = 0
+            self.active[EXCLUDE].add(prefix)
+
+    def __len__(self):
+        return self.size
+
+    def size_bucket(self, width, height):
+        """
+        get the bucket label for an image size
+
+        Args:
+            width (int): the pixel width
+            height (int): the pixel height
+
+        Returns:
+            str: the bucket label
+        """
+        largest = max(width, height)
+        if largest <= 0:
+            return UNKNOWN_SIZE
+        for limit, label in self.size_buckets:
+            if limit is None or largest <= limit:
+                return label
+
+    def add(self, img_path, img_ext, addl_sizes, img_size=None):
+        """
+        add an item to the end of the facet bitsets
+
+        Args:
+            img_path (str): the full path to the image
+            img_ext (str): the file extension for this image
+            addl_sizes (list[str]): a list of suffixes for alternate image sizes
+            img_size (tuple[int, int]): the pixel size, read from the image header if not given
+
+        Returns:
+            int: the catalog index of the new item
+        """
+        index = self.size
+        bit = 1 << index
+
+        self._set_bit(EXTENSION, img_ext.lstrip(".").lower(), bit)
+        self._set_bit(SIZE, self.size_bucket(*(img_size or image_size(img_path))), bit)
+        self._set_bit(LOCATION, top_level_location(img_path), bit)
+        if len(addl_sizes) > 1:
+            self._set_bit(VARIANTS, HAS_VARIANTS, bit)
+        for prefix in self.bits[EXCLUDE]:
+            if img_path.startswith(prefix):
+                self._set_bit(EXCLUDE, prefix, bit)
+
+        self.size += 1
+        self.alive |= bit
+
+        return index
+
+    def remove(self, index):
+        """
+        remove an item from every facet, its catalog index is not reused
+
+        Args:
+            index (int): the catalog index
+        """
+        bit = ~(1 << index)
+        self.alive &= bit
+        for values in self.bits.values():
+            for value in values:
+                values[value] &= bit
+
+    def _set_bit(self, group, value, bit):
+        self.bits[group][value] = self.bits[group].get(value, 0) | bit
+
+    def values(self, group):
+        """
+        get the known values of a facet group
+
+        Args:
+            group (str): the facet group name
+
+        Returns:
+            list[str]: the values in the order they were first seen
+        """
+        return list(self.bits[group])
+
+    def is_active(self, group, value):
+        """
+        Args:
+            group (str): the facet group name
+            value (str): the facet value
+
+        Returns:
+            bool: True if the value is currently used for filtering
+        """
+        return value in self.active[group]
+
+    def set_active(self, group, value, state):
+        """
+        turn a facet value on or off
+
+        Args:
+            group (str): the facet group name
+            value (str): the facet value
+            state (bool): True to filter with this value
+        """
+        if value not in self.bits[group]:
+            raise ValueError("Unknown facet value '{}' for '{}'".format(value, group))
+
+        if state:
+            self.active[group].add(value)
+        else:
+            self.active[group].discard(value)
+
+    def mask(self):
+        """
+        combine all active facet values into one bitset
+
+        Returns:
+            int: a bitset over catalog indices of the items passing every facet
+        """
+        result = self.alive
+        for group, values in self.active.items():
+            if not values:
+                continue
+
+            group_bits = 0
+            for value in values:
+                group_bits |= self.bits[group][value]
+
+            if group == EXCLUDE:
+                result &= ~group_bits
+            else:
+                result &= group_bits
+
+        return result
+
+    def indices(self):
+        """
+        Returns:
+            list[int]: the catalog indices passing every facet, in catalog order
+        """
+        return list(iter_bits(self.mask()))
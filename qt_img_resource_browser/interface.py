@@ -8,9 +8,11 @@ Examples:
     interface.load()
 """
 import os
+import bisect
 import logging
 import webbrowser
 from functools import partial
+import maya.api.OpenMaya as om
 from maya.app.general.mayaMixin import MayaQWidgetBaseMixin
 
 try:
@@ -18,7 +20,12 @@ try:
 except ImportError:
     from vendor.Qt import QtCore, QtWidgets, QtGui
 
+from svg import svg_cache
 from app import QtImgResourceData
+from search import FuzzyMatcher, iter_bits
+from prefetch import ThumbnailPrefetcher
+from export import GalleryExporter
+from facets import FacetIndex, EXTENSION, SIZE, VARIANTS, LOCATION, EXCLUDE
 from utils import make_shelf_icon
 
 log = logging.getLogger(__name__)
@@ -30,11 +37,24 @@ icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
 class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow):
     """
     Qt UI class to display the tool window
+
+    closing the window only hides it so ``load()`` can show it again without rebuilding, while hidden the
+    thumbnail caches are trimmed and after ``hidden_release_delay`` they are released completely
+
     Args:
         parent (QtWidgets.QWidget): the parent for this window, since we are subclassing MayaQWidgetBaseMixin this
             is not required
+
+    Class Attributes:
+        hidden_release_delay (int): milliseconds the window stays hidden before all thumbnails are released
+        hidden_svg_renderers (int): parsed svg documents kept while the window is hidden
+        hidden_svg_rasters (int): rendered svg images kept while the window is hidden
     """
 
+    hidden_release_delay = 60000
+    hidden_svg_renderers = 32
+    hidden_svg_rasters = 128
+
     def __init__(self, parent=None):
         super(QtImgResourceBrowserInterface, self).__init__(parent=parent)
 
@@ -43,14 +63,14 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
         self.setFixedWidth(500)
         self.setWindowTitle("Qt Image Resource Browser")
         self.setWindowIcon(QtGui.QPixmap(os.path.join(icon_path, "lc.png"), parent=self))
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
         # ini file to store window settings
         self.win_settings = QtCore.QSettings("leocov", "QtImgResourceBrowserInterface")
 
         # instance vars
         self.app = QtImgResourceData()
-        self.app.build_img_dict()
+        # exclusions are kept in the data and filtered live with the facets
+        self.app.build_img_dict(apply_exclusions=False)
         self.data_list = self.app.dict_as_sorted_list(by_path=True)
 
         # fonts
@@ -69,11 +89,26 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
         self.utils_menu = QtWidgets.QMenu("Utils", self.menu_bar)
         self.menu_bar.addMenu(self.utils_menu)
 
+        # filter menu, populated once the scroll area has built its facets
+        self.filter_menu = QtWidgets.QMenu("Filter", self.menu_bar)
+        self.menu_bar.addMenu(self.filter_menu)
+        self.filter_group_menus = []
+
         self.add_shelf_icon = QtWidgets.QAction("Add Shelf Icon",
                                                 self.utils_menu,
                                                 triggered=self.add_shelf_icon)
         self.utils_menu.addAction(self.add_shelf_icon)
 
+        self.export_gallery_action = QtWidgets.QAction("Export Gallery...",
+                                                       self.utils_menu,
+                                                       triggered=self.export_gallery)
+        self.utils_menu.addAction(self.export_gallery_action)
+
+        self.refresh_action = QtWidgets.QAction("Refresh Resources",
+                                                self.utils_menu,
+                                                triggered=self.refresh_resources)
+        self.utils_menu.addAction(self.refresh_action)
+
         # help menu
         self.help_menu = QtWidgets.QMenu("Help", self.menu_bar)
         self.menu_bar.addMenu(self.help_menu)
@@ -140,13 +175,15 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
         progress_layout.addStretch()
 
         # scroll area
-        self.scroll = ResourceBrowserList(self.data_list, parent=self)
+        self.scroll = ResourceBrowserList(self.data_list, exclusions=self.app.config["path_exclusions"], parent=self)
         self.scroll.return_count.connect(self.set_custom_title)
         self.scroll.start_progress.connect(self.init_progress)
         self.scroll.update_progress.connect(self.update_progress)
         self.scroll.end_progress.connect(self.end_progress)
         self.stack.addWidget(self.scroll)
 
+        self.populate_filter_menu()
+
         # A filtering bar
         filter_bar_height = 28
 
@@ -176,6 +213,20 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
         # Restore window's previous geometry
         self.restoreGeometry(self.win_settings.value("windowGeometry"))
 
+        # release memory once the window has been hidden for a while
+        self.release_timer = QtCore.QTimer(self)
+        self.release_timer.setSingleShot(True)
+        self.release_timer.setInterval(self.hidden_release_delay)
+        self.release_timer.timeout.connect(self.release_caches)
+
+        # plugins can register resource bundles, pick them up as they load and unload
+        self.plugin_callbacks = [om.MSceneMessage.addStringArrayCallback(message, self.plugin_changed)
+                                 for message in (om.MSceneMessage.kAfterPluginLoad,
+                                                 om.MSceneMessage.kAfterPluginUnload)]
+        # the window can be deleted without teardown(), so the callbacks go with the C++ object.
+        # its own methods can't run by then, the slot only holds on to the callback ids
+        self.destroyed.connect(partial(remove_callbacks, self.plugin_callbacks))
+
     @staticmethod
     def add_shelf_icon():
         """
@@ -186,6 +237,36 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
                         "import qt_img_resource_browser.interface as interface\ninterface.load()",
                         annotation="Open the Qt Image Resource Browser")
 
+    def export_gallery(self):
+        """
+        export the images passing the current filters as contact sheets and an html gallery
+        """
+        output_dir = QtWidgets.QFileDialog.getExistingDirectory(parent=self, caption="Export Gallery To")
+        if not output_dir:
+            return
+
+        export_list = [self.data_list[i] for i in self.scroll.path_ordered(self.scroll.facets.mask())]
+        exporter = GalleryExporter(export_list, output_dir)
+
+        def progress(num_pages):
+            self.update_progress(num_pages)
+            QtWidgets.QApplication.processEvents()
+
+        self.init_progress(exporter.num_pages)
+        try:
+            gallery_path = exporter.export(progress_callback=progress)
+        finally:
+            self.end_progress()
+
+        if exporter.failed_pages:
+            failures = "\n".join("page {}: {}".format(page, message)
+                                  for page, message in sorted(exporter.failed_pages.items()))
+            QtWidgets.QMessageBox.warning(self,
+                                          "Export Gallery",
+                                          "Some contact sheets could not be exported:\n{}".format(failures))
+
+        webbrowser.open("file:///{}".format(gallery_path.replace("\\", "/").lstrip("/")), new=2)
+
     @staticmethod
     def get_about():
         """
@@ -201,6 +282,33 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
         """
         webbrowser.open("https://github.com/leocov-dev/maya-qt-img-resource-browser/issues", new=2)
 
+    def populate_filter_menu(self):
+        """
+        add a sub menu of checkable facet values for each facet group, values without any images are
+        left out unless they are active so they can still be turned off
+        """
+        # clear() only deletes the actions, the sub menus have to be deleted on their own
+        self.filter_menu.clear()
+        for group_menu in self.filter_group_menus:
+            group_menu.deleteLater()
+        self.filter_group_menus = []
+
+        facets = self.scroll.facets
+        for group in (EXTENSION, SIZE, VARIANTS, LOCATION, EXCLUDE):
+            values = [value for value in facets.values(group)
+                      if facets.bits[group][value] & facets.alive or facets.is_active(group, value)]
+            if not values:
+                continue
+
+            group_menu = self.filter_menu.addMenu(group)
+            self.filter_group_menus.append(group_menu)
+            for value in values:
+                action = QtWidgets.QAction(value, group_menu)
+                action.setCheckable(True)
+                action.setChecked(facets.is_active(group, value))
+                action.toggled.connect(partial(self.scroll.set_facet, group, value))
+                group_menu.addAction(action)
+
     def init_progress(self, max_value):
         """
         show and start the progress bar
@@ -241,22 +349,73 @@ class QtImgResourceBrowserInterface(MayaQWidgetBaseMixin, QtWidgets.QMainWindow)
         """
         self.setWindowTitle("Qt Image Resource Browser - {}".format(num))
 
+    def plugin_changed(self, *args):
+        """
+        a plugin was loaded or unloaded, refresh once Maya is back in the event loop
+        """
+        QtCore.QTimer.singleShot(0, self.refresh_resources)
+
+    def refresh_resources(self):
+        """
+        update the list with resource bundles registered or unregistered since the window was built
+        """
+        removed, added = self.app.refresh()
+        if not removed and not added:
+            return
+
+        self.scroll.apply_changes(removed, [(name, self.app.data_dict[name]) for name in added])
+        self.populate_filter_menu()
+
+    def release_caches(self):
+        """
+        release every thumbnail and cached svg, they are decoded again when the window is shown
+        """
+        self.scroll.release_thumbnails()
+        svg_cache.clear()
+
+    def teardown(self):
+        """
+        close the window for good and delete it along with all its children
+        """
+        self.release_timer.stop()
+        self.scroll.teardown()
+        self.close()
+        self.deleteLater()
+
+    def showEvent(self, event):
+        """
+        cancel any pending release and decode the thumbnails in view
+        """
+        self.release_timer.stop()
+        self.scroll.prefetcher.schedule()
+
+        super(QtImgResourceBrowserInterface, self).showEvent(event)
+
+    def hideEvent(self, event):
+        """
+        trim the caches down to what is needed to show the window again quickly
+        """
+        self.scroll.trim_thumbnails()
+        svg_cache.trim(self.hidden_svg_renderers, self.hidden_svg_rasters)
+        self.release_timer.start()
+
+        super(QtImgResourceBrowserInterface, self).hideEvent(event)
+
     def closeEvent(self, event):
         """
-        when closing the window, also explicitly close the scroll area so that its own closeEvent will trigger
+        closing only hides the window, so it can be reused by ``load()``
         """
         # Save window's geometry
         self.win_settings.setValue("windowGeometry", self.saveGeometry())
 
-        # clean up the scroll area and all its children
-        self.scroll.close()
-
         event.accept()
 
 
 class ResourceBrowserItem(QtWidgets.QWidget):
     """
-    a single image resource item widget
+    a single image resource item widget, the preview starts as a blank checker and is filled in
+    by ``set_thumbnail()`` once it has been decoded
+
     Args:
         img_path (str): the full path to the image
         img_name (str): the name of the image only
@@ -280,6 +439,8 @@ class ResourceBrowserItem(QtWidgets.QWidget):
         self.img_name = img_name
         self.img_ext = img_ext
         self.addl_sizes = addl_sizes
+        self.img_size = QtCore.QSize()
+        self.has_thumbnail = False
 
         # self style
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
@@ -298,32 +459,9 @@ class ResourceBrowserItem(QtWidgets.QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(self.layout)
 
-        # checker/solid label
-        px_checker = QtGui.QPixmap(os.path.join(icon_path, "checker.png"), parent=self)
-
-        # preview pixmap
-        self.px_image = QtGui.QPixmap(self.img_path, parent=self)
-
-        # image's natural size
-        self.img_size = self.px_image.size()
-
-        px_preview = self.px_image
-        # scale to fit in widget
-        if self.px_image.height() > self.max_height:
-            px_preview = self.px_image.scaledToHeight(self.max_height, QtCore.Qt.SmoothTransformation)
-        if self.px_image.width() > self.max_height:
-            px_preview = self.px_image.scaledToWidth(self.max_height, QtCore.Qt.SmoothTransformation)
-
-        # combine pixmaps with a painter
-        painter = QtGui.QPainter()
-        painter.begin(px_checker)
-        painter.drawPixmap((px_checker.width() - px_preview.width()) / 2,
-                           (px_checker.height() - px_preview.height()) / 2,
-                           px_preview)
-        painter.end()
-
+        # checker/solid label, the preview is drawn on top of it later
         self.lbl_combined = QtWidgets.QLabel(parent=self)
-        self.lbl_combined.setPixmap(px_checker)
+        self.lbl_combined.setPixmap(QtGui.QPixmap(os.path.join(icon_path, "checker.png")))
 
         self.layout.addWidget(self.lbl_combined)
 
@@ -353,8 +491,7 @@ class ResourceBrowserItem(QtWidgets.QWidget):
         self.ly_info.addWidget(self.lbl_ext)
 
         # size label
-        self.lbl_size = QtWidgets.QLabel("w: {} h: {}".format(self.img_size.width(), self.img_size.height()),
-                                         parent=self)
+        self.lbl_size = QtWidgets.QLabel("w: - h: -", parent=self)
         self.ly_info.addWidget(self.lbl_size)
 
         # layout clip path string
@@ -386,6 +523,67 @@ class ResourceBrowserItem(QtWidgets.QWidget):
         self.btn_save.clicked.connect(self.save_image)
         self.ly_clip.addWidget(self.btn_save)
 
+    def set_thumbnail(self, image, img_size):
+        """
+        draw a decoded preview on the checker background
+
+        Args:
+            image (QtGui.QImage): the preview, already scaled to fit in ``max_height`` logical pixels
+            img_size (QtCore.QSize): the natural size of the image
+        """
+        self.img_size = img_size
+        self.lbl_size.setText("w: {} h: {}".format(img_size.width(), img_size.height()))
+
+        px_preview = QtGui.QPixmap.fromImage(image)
+        # Qt 4 has no device pixel ratio, pixmaps there are always at 1.0
+        device_pixel_ratio = px_preview.devicePixelRatio() if hasattr(px_preview, "devicePixelRatio") else 1.0
+        px_checker = self.checker_pixmap(device_pixel_ratio)
+
+        # combine pixmaps with a painter, positions are in logical pixels
+        preview_size = px_preview.size() / device_pixel_ratio
+        painter = QtGui.QPainter()
+        painter.begin(px_checker)
+        painter.drawPixmap(QtCore.QPointF((self.max_height - preview_size.width()) / 2.0,
+                                          (self.max_height - preview_size.height()) / 2.0),
+                           px_preview)
+        painter.end()
+
+        self.lbl_combined.setPixmap(px_checker)
+        self.has_thumbnail = True
+
+    @staticmethod
+    def checker_pixmap(device_pixel_ratio):
+        """
+        get the checker background at the closest available resolution for a device pixel ratio
+
+        Args:
+            device_pixel_ratio (float): the device pixel ratio of the preview drawn on top
+
+        Returns:
+            QtGui.QPixmap: the checker with its device pixel ratio set
+        """
+        if device_pixel_ratio >= 2.0:
+            checker_name, checker_ratio = "checker_200.png", 2.0
+        elif device_pixel_ratio >= 1.5:
+            checker_name, checker_ratio = "checker_150.png", 1.5
+        else:
+            checker_name, checker_ratio = "checker.png", 1.0
+
+        px_checker = QtGui.QPixmap(os.path.join(icon_path, checker_name))
+        if hasattr(px_checker, "setDevicePixelRatio"):
+            px_checker.setDevicePixelRatio(checker_ratio)
+        return px_checker
+
+    def release_thumbnail(self):
+        """
+        drop the decoded preview and show the blank checker again
+        """
+        if not self.has_thumbnail:
+            return
+
+        self.lbl_combined.setPixmap(self.checker_pixmap(1.0))
+        self.has_thumbnail = False
+
     def emit_path(self):
         """
         emit path string
@@ -400,7 +598,7 @@ class ResourceBrowserItem(QtWidgets.QWidget):
                                                               caption="Save Image Resource - {}".format(self.img_name),
                                                               filter="Images (*.png)")
         if save_path:
-            self.px_image.save(save_path, quality=100)
+            QtGui.QPixmap(self.img_path).save(save_path, quality=100)
 
 
 class ResourceBrowserList(QtWidgets.QScrollArea):
@@ -408,9 +606,19 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
     a scroll area containing a list of qt image resources
     Args:
         data_list (list): a list of image resource tuples, a name and a dictionary of data
+        exclusions (list[str]): path prefixes that are hidden until their facet is turned off
         parent (QtWidgets.QWidget): the parent for this object
+
+    Class Attributes:
+        max_results (int): the maximum number of ranked search results added to the list
+        row_height (int): the height of one item in the list
+        hidden_thumbnail_budget (int): thumbnails kept around the scroll position by ``trim_thumbnails()``
     """
 
+    max_results = 300
+    hidden_thumbnail_budget = 100
+    row_height = ResourceBrowserItem.max_height
+
     clipboard = QtWidgets.QApplication.clipboard()
 
     return_count = QtCore.Signal(int)
@@ -418,13 +626,27 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
     update_progress = QtCore.Signal(int)
     end_progress = QtCore.Signal()
 
-    def __init__(self, data_list, parent=None):
+    def __init__(self, data_list, exclusions=None, parent=None):
         super(ResourceBrowserList, self).__init__(parent=parent)
 
         # instance vars
         self.data_list = data_list
         self.widget_list = []
         self.filtered_widget_list = []
+        self.filter_string = ""
+        self.initialized = False
+
+        # search and facet tables, the catalog index of each item is its position in ``data_list``
+        self.matcher = FuzzyMatcher([data["img_name"] for __, data in self.data_list],
+                                    [data["img_path"] for __, data in self.data_list])
+        self.facets = FacetIndex(exclusions)
+        for __, data in self.data_list:
+            self.facets.add(data["img_path"], data["img_ext"], data["addl_sizes"])
+        self.catalog_index = dict((name, i) for i, (name, __) in enumerate(self.data_list))
+
+        # catalog indices sorted by lower case path, entries added later are inserted in place
+        self.path_order = sorted(range(len(self.data_list)), key=lambda i: self.matcher.lower_paths[i])
+        self.sorted_paths = [self.matcher.lower_paths[i] for i in self.path_order]
 
         # scroll area policies
         self.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
@@ -452,6 +674,9 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
         # add the container to the scroll
         self.setWidget(self.container)
 
+        # decodes previews for the rows around the viewport
+        self.prefetcher = ThumbnailPrefetcher(self)
+
     def copy_to_clipboard(self, string):
         """
         copy the string to the system clipboard
@@ -462,18 +687,22 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
 
     def filter_widgets(self, filter_string):
         """
-        filter the list of displayed widgets who's names contain the given ``filter_string``.
+        filter the list of displayed widgets to the best fuzzy matches for ``filter_string``.
+        matches are ordered best first and only the top ``max_results`` are added to the list,
+        with an empty ``filter_string`` every widget is shown sorted by path.
+        only widgets passing the active facets are considered
 
         Args:
-            filter_string (str): search image names for this string
+            filter_string (str): search image names and paths for this string
         """
         # might seem easier to hide and show widgets based on the filter, but show() is very, very slow
 
-        new_filtered_list = []
-        for item in self.widget_list:
-            if filter_string and filter_string.lower() not in item.img_name.lower():
-                continue
-            new_filtered_list.append(item)
+        self.filter_string = filter_string
+
+        if not self.widget_list:
+            return
+
+        new_filtered_list = [self.widget_list[i] for i in self.filtered_indices()]
 
         if new_filtered_list == self.filtered_widget_list:
             return
@@ -501,6 +730,126 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
 
         self.end_progress.emit()
 
+        # the rows in view have changed, prefetch for the new list. a hidden list is scheduled once shown
+        if self.isVisible():
+            self.prefetcher.reset()
+
+    def filtered_indices(self):
+        """
+        Returns:
+            list[int]: the catalog indices passing ``filter_string`` and the active facets, in display order
+        """
+        facet_bits = self.facets.mask()
+        if self.filter_string.strip():
+            return self.matcher.search(self.filter_string, limit=self.max_results, candidates=facet_bits)
+        return self.path_ordered(facet_bits)
+
+    def update_layout(self, new_filtered_list):
+        """
+        change the layout from ``filtered_widget_list`` to ``new_filtered_list`` by removing and inserting
+        only the items that differ, items keeping their relative order are not touched
+
+        Args:
+            new_filtered_list (list[ResourceBrowserItem]): the items to show in display order
+        """
+        old_items = set(self.filtered_widget_list)
+        new_items = set(new_filtered_list)
+
+        for item in self.filtered_widget_list:
+            if item not in new_items:
+                self.layout.removeWidget(item)
+
+        for row, item in enumerate(new_filtered_list):
+            layout_item = self.layout.itemAt(row)
+            if layout_item is not None and layout_item.widget() is item:
+                continue
+            # an item shown further down moves up to this row
+            if item in old_items:
+                self.layout.removeWidget(item)
+            self.layout.insertWidget(row, item)
+
+        self.filtered_widget_list = new_filtered_list
+
+        self.return_count.emit(len(self.filtered_widget_list))
+        self.update_container_size()
+
+        if self.isVisible():
+            self.prefetcher.reset()
+
+    def path_ordered(self, bits):
+        """
+        Args:
+            bits (int): a bitset over catalog indices
+
+        Returns:
+            list[int]: the catalog indices in ``bits`` sorted by path
+        """
+        visible = set(iter_bits(bits))
+        return [i for i in self.path_order if i in visible]
+
+    def set_facet(self, group, value, state):
+        """
+        turn a facet value on or off and re-apply the current filter
+
+        Args:
+            group (str): the facet group name
+            value (str): the facet value
+            state (bool): True to filter with this value
+        """
+        self.facets.set_active(group, value, state)
+        self.filter_widgets(self.filter_string)
+
+    def apply_changes(self, removed, added):
+        """
+        remove and add catalog entries without rebuilding the list, only the changed items are
+        deleted or created and then inserted into or removed from the layout. removed entries leave
+        a ``None`` in ``data_list`` and ``widget_list`` so the catalog indices of all other items stay
+        valid, new entries are appended to the catalog but inserted in ``path_order`` so the
+        unfiltered list stays sorted by path
+
+        Args:
+            removed (list[str]): the image names to remove
+            added (list): image resource tuples to add, a name and a dictionary of data
+        """
+        for name in removed:
+            index = self.catalog_index.pop(name, None)
+            if index is None:
+                continue
+
+            path = self.matcher.lower_paths[index]
+            pos = bisect.bisect_left(self.sorted_paths, path)
+            while self.path_order[pos] != index:
+                pos += 1
+            del self.path_order[pos]
+            del self.sorted_paths[pos]
+
+            self.matcher.remove(index)
+            self.facets.remove(index)
+            self.data_list[index] = None
+
+            if index < len(self.widget_list):
+                item = self.widget_list[index]
+                self.widget_list[index] = None
+                item.deleteLater()
+
+        for name, data in added:
+            index = len(self.data_list)
+            path = data["img_path"].lower()
+            pos = bisect.bisect_right(self.sorted_paths, path)
+            self.path_order.insert(pos, index)
+            self.sorted_paths.insert(pos, path)
+
+            self.catalog_index[name] = index
+            self.data_list.append((name, data))
+            self.matcher.add(data["img_name"], data["img_path"])
+            self.facets.add(data["img_path"], data["img_ext"], data["addl_sizes"])
+
+            if self.initialized:
+                self.add_resource_item(data["img_path"], data["img_name"], data["img_ext"], data["addl_sizes"])
+
+        if self.initialized:
+            self.update_layout([self.widget_list[i] for i in self.filtered_indices()])
+
     def add_resource_item(self, img_path, img_name, img_ext, addl_sizes):
         """
         add a new resource item to the scroll area
@@ -513,7 +862,8 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
         Returns:
             ResourceBrowserItem: the item just added
         """
-        item_widget = ResourceBrowserItem(img_path, img_name, img_ext, addl_sizes, parent=self)
+        # parent to the container, even items that are never laid out are deleted along with it
+        item_widget = ResourceBrowserItem(img_path, img_name, img_ext, addl_sizes, parent=self.container)
         item_widget.copy_text.connect(self.copy_to_clipboard)
         self.widget_list.append(item_widget)
 
@@ -523,12 +873,19 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
         """
         initialize the entire widget list
         """
+        self.initialized = True
+
         if not self.data_list:
             return
 
         self.start_progress.emit(len(self.data_list))
 
         for i, list_item in enumerate(self.data_list):
+            # keep the catalog indices aligned for entries removed before the list was built
+            if list_item is None:
+                self.widget_list.append(None)
+                continue
+
             name, data = list_item
             img_path = data["img_path"]
             img_name = data["img_name"]
@@ -545,7 +902,7 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
 
         num_widgets = len(self.filtered_widget_list)
 
-        new_height = num_widgets * ResourceBrowserItem.max_height
+        new_height = num_widgets * self.row_height
         new_height += (num_widgets - 1) * self.layout.spacing()
         self.container.setFixedHeight(new_height)
 
@@ -556,34 +913,94 @@ class ResourceBrowserList(QtWidgets.QScrollArea):
 
         log.debug("Update Size")
 
-    def closeEvent(self, event):
+    def resizeEvent(self, event):
         """
-        close all child widgets explicitly on closing this widget
+        a taller viewport shows more rows, prefetch for them
         Args:
             event: the event object
         """
-        # clean up any child widgets
+        super(ResourceBrowserList, self).resizeEvent(event)
+        self.prefetcher.schedule()
+
+    def trim_thumbnails(self, budget=None):
+        """
+        stop decoding and release every thumbnail except those closest to the scroll position
+
+        Args:
+            budget (int): the number of thumbnails to keep, defaults to ``hidden_thumbnail_budget``
+        """
+        if budget is None:
+            budget = self.hidden_thumbnail_budget
+
+        self.prefetcher.stop()
+
+        keep = set(self.filtered_widget_list[row] for row in self.prefetcher.prioritized_rows()[:budget])
         for item in self.widget_list:
-            try:
-                item.close()
-            except:
-                pass
+            if item is not None and item not in keep:
+                item.release_thumbnail()
+
+    def release_thumbnails(self):
+        """
+        stop decoding and release every thumbnail
+        """
+        self.trim_thumbnails(0)
+
+    def teardown(self):
+        """
+        stop decoding and delete every item in one go
+        """
+        self.prefetcher.stop()
+
+        self.widget_list = []
+        self.filtered_widget_list = []
+
+        # every item is created as a child of the container, deleting it deletes them all on the C++ side
+        self.container.deleteLater()
+
+    def closeEvent(self, event):
+        """
+        delete all child widgets on closing this widget
+        Args:
+            event: the event object
+        """
+        self.teardown()
 
         event.accept()
 
 
-def load():
+def remove_callbacks(callback_ids, *args):
+    """
+    remove Maya message callbacks, used as a slot for ``destroyed`` signals
+
+    Args:
+        callback_ids (list): the ids returned when the callbacks were added
+    """
+    om.MMessage.removeCallbacks(callback_ids)
+
+
+def load(rebuild=False):
     """
     entry point for the UI, launch an instance of the tool with this method
+    an existing window is shown again instead of being rebuilt
+
+    Args:
+        rebuild (bool): delete any existing window and build a new one
     """
     global _win
     try:
-        _win.close()
+        if rebuild:
+            _win.teardown()
+        else:
+            _win.refresh_resources()
+            _win.show()
+            _win.raise_()
+            _win.activateWindow()
+            return
     except (NameError, RuntimeError):
         pass
-    finally:
-        _win = QtImgResourceBrowserInterface()
-        _win.setWindowFlags(QtCore.Qt.Window)
-        _win.show()
 
-        QtCore.QTimer.singleShot(50, _win.scroll.initialize_widget_list)
+    _win = QtImgResourceBrowserInterface()
+    _win.setWindowFlags(QtCore.Qt.Window)
+    _win.show()
+
+    QtCore.QTimer.singleShot(50, _win.scroll.initialize_widget_list)
@@ -0,0 +1,282 @@
+"""
+thumbnail prefetch module, decodes image previews on a thread pool ahead of the scroll position
+
+the scheduler watches the scroll bar of a ``ResourceBrowserList``, estimates how fast and in which
+direction it is moving and queues preview decodes for the rows about to become visible first.
+rows that scroll far away are dropped from the queue before their decode ever starts
+"""
+import time
+import logging
+
+try:
+    from PySide2 import QtCore, QtGui
+except ImportError:
+    from vendor.Qt import QtCore, QtGui
+
+from svg import svg_cache, is_svg
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.CRITICAL)
+
+
+class _ThumbnailSignals(QtCore.QObject):
+    """
+    QRunnable can't emit signals, so each job reports back through this object
+    """
+    finished = QtCore.Signal(int, QtGui.QImage, QtCore.QSize)
+
+
+class ThumbnailJob(QtCore.QRunnable):
+    """
+    decode and scale one image preview off the main thread
+
+    QImage is safe to use outside the gui thread, the result is converted to a QPixmap
+    by the item once it is back on the main thread. svg images are rendered at the exact
+    preview size and device pixel ratio by the shared ``svg_cache``
+
+    Args:
+        job_id (int): the id reported back with the result
+        img_path (str): the full path to the image
+        max_size (int): the largest width or height for the preview
+        device_pixel_ratio (float): the device pixel ratio of the screen the preview is shown on
+        signals (_ThumbnailSignals): the object used to report the result
+    """
+
+    def __init__(self, job_id, img_path, max_size, device_pixel_ratio, signals):
+        super(ThumbnailJob, self).__init__()
+
+        self.job_id = job_id
+        self.img_path = img_path
+        self.max_size = max_size
+        self.device_pixel_ratio = device_pixel_ratio
+        self.signals = signals
+
+    def run(self):
+        # an exception can't leave the pool's thread, always report back so the prefetcher frees the slot
+        try:
+            image, img_size = self.decode()
+        except Exception as e:
+            log.error("thumbnail failed: {} {}".format(self.img_path, e))
+            image, img_size = QtGui.QImage(), QtCore.QSize()
+
+        self.signals.finished.emit(self.job_id, image, img_size)
+
+    def decode(self):
+        """
+        decode the image and scale it down to fit in ``max_size``
+
+        Returns:
+            tuple[QtGui.QImage, QtCore.QSize]: the scaled preview and the natural size of the image
+        """
+        if is_svg(self.img_path):
+            return svg_cache.render(self.img_path, self.max_size, self.device_pixel_ratio)
+
+        image = QtGui.QImage(self.img_path)
+        img_size = image.size()
+
+        if image.width() > self.max_size or image.height() > self.max_size:
+            image = image.scaled(self.max_size, self.max_size,
+                                 QtCore.Qt.KeepAspectRatio,
+                                 QtCore.Qt.SmoothTransformation)
+
+        return image, img_size
+
+
+class ThumbnailPrefetcher(QtCore.QObject):
+    """
+    schedule thumbnail decodes for a ``ResourceBrowserList`` based on scroll position and velocity
+
+    every time the list scrolls the queue is rebuilt in priority order, visible rows first, then the rows
+    ahead in the scroll direction and finally a few rows behind. the look ahead grows with the scroll
+    velocity so a fast flick still finds its previews ready. at most ``max_in_flight`` decodes run at once
+
+    Args:
+        browser_list (ResourceBrowserList): the scroll area to prefetch for
+
+    Class Attributes:
+        max_in_flight (int): the maximum number of decodes running at the same time
+        base_lookahead (int): rows prefetched past each edge of the viewport while idle
+        max_lookahead (int): the upper limit of rows prefetched ahead of the viewport
+        lookahead_time (float): seconds of scrolling at the current velocity to prefetch for
+        idle_time (float): seconds without scrolling before the velocity is reset
+        schedule_interval (int): milliseconds used to coalesce scroll events into one scheduling pass
+    """
+
+    max_in_flight = 4
+    base_lookahead = 8
+    max_lookahead = 150
+    lookahead_time = 0.5
+    idle_time = 0.15
+    schedule_interval = 16
+
+    def __init__(self, browser_list):
+        super(ThumbnailPrefetcher, self).__init__(parent=browser_list)
+
+        self.browser_list = browser_list
+
+        self.queue = []
+        self.in_flight = {}
+        self.next_job_id = 0
+
+        self.velocity = 0.0
+        self.last_value = 0
+        self.last_time = time.time()
+        self.device_pixel_ratio = self.current_device_pixel_ratio()
+
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_in_flight)
+
+        self.signals = _ThumbnailSignals(self)
+        self.signals.finished.connect(self.job_finished)
+
+        # coalesce bursts of scroll events into one scheduling pass
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.schedule_interval)
+        self.timer.timeout.connect(self.schedule)
+
+        self.browser_list.verticalScrollBar().valueChanged.connect(self.track_scroll)
+
+    @property
+    def row_pitch(self):
+        """
+        Returns:
+            int: the vertical distance in pixels from the top of one row to the next
+        """
+        return self.browser_list.row_height + self.browser_list.layout.spacing()
+
+    def current_device_pixel_ratio(self):
+        """
+        Returns:
+            float: the device pixel ratio of the screen the list is shown on
+        """
+        # devicePixelRatioF is missing from older bindings and Qt 4 has no device pixel ratio at all
+        ratio = (getattr(self.browser_list, "devicePixelRatioF", None)
+                 or getattr(self.browser_list, "devicePixelRatio", None))
+        return float(ratio()) if ratio else 1.0
+
+    def track_scroll(self, value):
+        """
+        update the scroll velocity and request a scheduling pass
+
+        Args:
+            value (int): the new scroll bar value
+        """
+        now = time.time()
+        elapsed = max(now - self.last_time, 0.001)
+
+        # smooth the velocity so a single jumpy event doesn't swing the look ahead
+        self.velocity = 0.5 * self.velocity + 0.5 * (value - self.last_value) / elapsed
+        self.last_value = value
+        self.last_time = now
+
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def reset(self):
+        """
+        drop every queued decode and schedule again, used when the list contents change
+        """
+        self.queue = []
+        self.velocity = 0.0
+        self.last_value = self.browser_list.verticalScrollBar().value()
+        self.schedule()
+
+    def stop(self):
+        """
+        drop every queued decode and ignore the results of those still running
+        """
+        self.timer.stop()
+        self.queue = []
+        self.in_flight = {}
+
+    def prioritized_rows(self):
+        """
+        get the rows that should have a thumbnail in the order they should be decoded
+
+        Returns:
+            list[int]: row positions in ``browser_list.filtered_widget_list``
+        """
+        num_rows = len(self.browser_list.filtered_widget_list)
+        if not num_rows:
+            return []
+
+        if time.time() - self.last_time > self.idle_time:
+            self.velocity = 0.0
+
+        pitch = self.row_pitch
+        top = self.browser_list.verticalScrollBar().value()
+        # the scroll value can be stale after the list shrank while hidden, keep both ends inside the list
+        first = min(max(top // pitch, 0), num_rows - 1)
+        last = min((top + self.browser_list.viewport().height()) // pitch, num_rows - 1)
+        if first > last:
+            return []
+
+        ahead = self.base_lookahead + int(abs(self.velocity) * self.lookahead_time / pitch)
+        ahead = min(ahead, self.max_lookahead)
+        behind = self.base_lookahead
+
+        if self.velocity < 0:
+            ahead_rows = range(first - 1, max(first - ahead, 0) - 1, -1)
+            behind_rows = range(last + 1, min(last + behind, num_rows - 1) + 1)
+        else:
+            ahead_rows = range(last + 1, min(last + ahead, num_rows - 1) + 1)
+            behind_rows = range(first - 1, max(first - behind, 0) - 1, -1)
+
+        return list(range(first, last + 1)) + list(ahead_rows) + list(behind_rows)
+
+    def schedule(self):
+        """
+        rebuild the queue from the current scroll position, rows outside the new window are cancelled
+        """
+        widgets = self.browser_list.filtered_widget_list
+
+        # the window moved to a screen with another scale, every preview has to be redone
+        device_pixel_ratio = self.current_device_pixel_ratio()
+        if device_pixel_ratio != self.device_pixel_ratio:
+            self.device_pixel_ratio = device_pixel_ratio
+            for widget in self.browser_list.widget_list:
+                if widget is not None:
+                    widget.has_thumbnail = False
+
+        pending = set(self.in_flight.values())
+
+        self.queue = [widgets[row] for row in reversed(self.prioritized_rows())
+                      if not widgets[row].has_thumbnail and widgets[row] not in pending]
+
+        self.submit()
+
+    def submit(self):
+        """
+        start queued decodes until ``max_in_flight`` are running
+        """
+        while self.queue and len(self.in_flight) < self.max_in_flight:
+            widget = self.queue.pop()
+
+            job_id = self.next_job_id
+            self.next_job_id += 1
+            self.in_flight[job_id] = widget
+
+            self.pool.start(ThumbnailJob(job_id, widget.img_path, widget.max_height,
+                                         self.device_pixel_ratio, self.signals))
+
+    def job_finished(self, job_id, image, img_size):
+        """
+        hand a decoded preview to its item and start the next queued decode
+
+        Args:
+            job_id (int): the finished job's id
+            image (QtGui.QImage): the scaled preview
+            img_size (QtCore.QSize): the natural size of the image
+        """
+        widget = self.in_flight.pop(job_id, None)
+        if widget is not None:
+            try:
+                widget.set_thumbnail(image, img_size)
+            except RuntimeError:
+                # the item was deleted while its preview was decoding
+                pass
+
+        self.submit()
+
+        log.debug("thumbnails queued: {} in flight: {}".format(len(self.queue), len(self.in_flight)))
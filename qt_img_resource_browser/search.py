@@ -0,0 +1,310 @@
+"""
+fuzzy search module for ranking image resources against a typed query
+
+the lookup tables are built once for the whole catalog so each keystroke only has to
+score the items that can possibly match and then rank the best few hundred of them
+"""
+import heapq
+import logging
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.CRITICAL)
+
+# scoring weights
+SCORE_EXACT = 1000
+SCORE_PREFIX = 600
+SCORE_SUBSTRING = 400
+SCORE_INITIALS = 350
+SCORE_BOUNDARY = 30
+SCORE_CONSECUTIVE = 20
+SCORE_CHAR = 10
+GAP_PENALTY = 1
+MAX_GAP_PENALTY = 30
+PATH_FACTOR = 0.5
+
+_separators = "_-./: "
+
+
+def word_boundaries(text):
+    """
+    find the positions in ``text`` that start a new word, this includes the first character,
+    any character after a separator, an upper case letter after a lower case letter and the
+    first digit of a number
+
+    Examples:
+        word_boundaries("fileOpen") -> (0, 4)
+        word_boundaries("out_nurbsCurve") -> (0, 4, 9)
+
+    Args:
+        text (str): the original (not lowered) text
+
+    Returns:
+        tuple[int]: sorted character positions
+    """
+    positions = []
+    prev = ""
+    for i, char in enumerate(text):
+        if char in _separators:
+            prev = char
+            continue
+        if (not prev
+                or prev in _separators
+                or (char.isupper() and prev.islower())
+                or (char.isdigit() and not prev.isdigit())):
+            positions.append(i)
+        prev = char
+    return tuple(positions)
+
+
+def is_subsequence(query, text, start=0):
+    """
+    Args:
+        query (str): the characters to find in order
+        text (str): the text to search
+        start (int): the position in ``text`` to start searching from
+
+    Returns:
+        bool: True if every character of ``query`` is found in ``text`` in order
+    """
+    for char in query:
+        start = text.find(char, start)
+        if start < 0:
+            return False
+        start += 1
+    return True
+
+
+def subsequence_score(query, text, boundaries):
+    """
+    score ``query`` as an ordered subsequence of ``text``
+
+    characters landing on a word boundary or directly after the previous match are rewarded
+    and gaps between matched characters are penalized, so "flop" scores well against "fileopen".
+    a character only jumps ahead to a word boundary if the rest of the query still fits after it
+
+    Args:
+        query (str): the lower case query
+        text (str): the lower case text to search
+        boundaries (tuple[int]): sorted word boundary positions in ``text``
+
+    Returns:
+        int: the match score or 0 if ``query`` is not a subsequence of ``text``
+    """
+    score = 0
+    pos = 0
+    last = -1
+    for i, char in enumerate(query):
+        found = text.find(char, pos)
+        if found < 0:
+            return 0
+
+        # prefer jumping ahead to a word boundary unless the match is consecutive
+        if found != last + 1 and found not in boundaries:
+            for b in boundaries:
+                if b > found and text[b] == char and is_subsequence(query[i + 1:], text, b + 1):
+                    found = b
+                    break
+
+        score += SCORE_CHAR
+        if found in boundaries:
+            score += SCORE_BOUNDARY
+        if found == last + 1:
+            score += SCORE_CONSECUTIVE
+        elif last >= 0:
+            score -= min(found - last - 1, MAX_GAP_PENALTY) * GAP_PENALTY
+
+        last = found
+        pos = found + 1
+
+    return score
+
+
+class FuzzyMatcher(object):
+    """
+    rank image resources by how well their name or path matches a query
+
+    all lower case strings, word boundary tables and per character bitsets are computed on
+    instantiation, the per character bitsets are intersected to skip every item that does not
+    contain all the query's characters before any scoring happens
+
+    Args:
+        names (list[str]): image names, the position in the list is the catalog index
+        paths (list[str]): image paths, must be the same length as ``names``
+
+    Class Attributes:
+        default_limit (int): the default number of results returned by ``search()``
+
+    Examples:
+        matcher = FuzzyMatcher(["fileOpen", "fileSave"], [":/fileOpen.png", ":/fileSave.png"])
+        matcher.search("flop") -> [0]
+    """
+
+    default_limit = 300
+
+    def __init__(self, names, paths):
+        if len(names) != len(paths):
+            raise ValueError("names and paths must be the same length")
+
+        self.names = []
+        self.lower_names = []
+        self.lower_paths = []
+        self.name_boundaries = []
+        self.path_boundaries = []
+        self.initials = []
+        self.char_bits = {}
+        self.alive = 0
+
+        for name, path in zip(names, paths):
+            self.add(name, path)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, path):
+        """
+        add an item to the end of the lookup tables
+
+        Args:
+            name (str): the image name
+            path (str): the image path
+
+        Returns:
+            int: the catalog index of the new item
+        """
+        index = len(self.names)
+        bit = 1 << index
+
+        name_bounds = word_boundaries(name)
+        self.names.append(name)
+        self.lower_names.append(name.lower())
+        self.lower_paths.append(path.lower())
+        self.name_boundaries.append(name_bounds)
+        self.path_boundaries.append(word_boundaries(path))
+        self.initials.append("".join(name[i] for i in name_bounds).lower())
+
+        for char in set(self.lower_names[index] + self.lower_paths[index]):
+            self.char_bits[char] = self.char_bits.get(char, 0) | bit
+        self.alive |= bit
+
+        return index
+
+    def remove(self, index):
+        """
+        remove an item from the search results, its catalog index is not reused
+
+        Args:
+            index (int): the catalog index
+        """
+        bit = 1 << index
+        for char in set(self.lower_names[index] + self.lower_paths[index]):
+            self.char_bits[char] &= ~bit
+        self.alive &= ~bit
+
+    def candidate_bits(self, query):
+        """
+        get a bitset of the items containing every character of ``query``, whitespace is ignored
+
+        Args:
+            query (str): the lower case query
+
+        Returns:
+            int: a bitset over catalog indices
+        """
+        bits = self.alive
+        for char in set("".join(query.split())):
+            bits &= self.char_bits.get(char, 0)
+            if not bits:
+                break
+        return bits
+
+    def score(self, query, index):
+        """
+        score a single catalog item against ``query``
+
+        Args:
+            query (str): the lower case query
+            index (int): the catalog index
+
+        Returns:
+            int: the score, 0 means no match
+        """
+        name = self.lower_names[index]
+
+        if name == query:
+            return SCORE_EXACT
+        if name.startswith(query):
+            return SCORE_PREFIX - len(name)
+
+        found = name.find(query)
+        if found >= 0:
+            bonus = SCORE_BOUNDARY if found in self.name_boundaries[index] else 0
+            return SCORE_SUBSTRING + bonus - found
+
+        initials = self.initials[index]
+        if len(query) > 1 and initials.startswith(query):
+            return SCORE_INITIALS - len(initials)
+
+        score = subsequence_score(query, name, self.name_boundaries[index])
+        if score:
+            return score
+
+        path = self.lower_paths[index]
+        if query in path:
+            return int((SCORE_SUBSTRING - len(path)) * PATH_FACTOR)
+
+        return int(subsequence_score(query, path, self.path_boundaries[index]) * PATH_FACTOR)
+
+    def search(self, query, limit=None, candidates=None):
+        """
+        find the best matches for ``query`` ordered best first
+
+        whitespace splits the query into terms, an item has to match every term and its score is
+        the sum of the term scores, so "file open" finds "fileOpen"
+
+        Args:
+            query (str): the text to search for, case is ignored
+            limit (int): the maximum number of results, defaults to ``default_limit``
+            candidates (int): an optional bitset restricting which catalog indices are considered
+
+        Returns:
+            list[int]: catalog indices of the best matches, best first
+        """
+        query = query.lower().strip()
+        terms = query.split()
+        if limit is None:
+            limit = self.default_limit
+
+        bits = self.candidate_bits(query)
+        if candidates is not None:
+            bits &= candidates
+
+        scored = []
+        for index in iter_bits(bits):
+            scores = [self.score(term, index) for term in terms]
+            score = sum(scores) if all(scores) else 0
+            if score > 0:
+                # shorter names win ties, then catalog order
+                scored.append((score, -len(self.names[index]), -index))
+
+        best = heapq.nlargest(limit, scored)
+        log.debug("search '{}': {} scored, {} kept".format(query, len(scored), len(best)))
+
+        return [-index for __, __, index in best]
+
+
+def iter_bits(bits):
+    """
+    iterate over the positions of the set bits in ``bits``
+
+    Args:
+        bits (int): a bitset
+
+    Yields:
+        int: the position of each set bit, lowest first
+    """
+    # reversing the binary string makes string positions equal bit positions
+    binary = bin(bits)[:1:-1]
+    pos = binary.find("1")
+    while pos >= 0:
+        yield pos
+        pos = binary.find("1", pos + 1)
@@ -0,0 +1,215 @@
+"""
+svg rendering module, rasterizes svg resources at an exact size and device pixel ratio
+
+parsed documents are kept in a pool of reusable QSvgRenderer instances and the finished rasters
+are cached per path, size and device pixel ratio, so each svg is parsed once and rasterized once per size
+"""
+import logging
+import threading
+from collections import OrderedDict
+
+try:
+    from PySide2 import QtCore, QtGui, QtSvg
+except ImportError:
+    from vendor.Qt import QtCore, QtGui, QtSvg
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.CRITICAL)
+
+
+def is_svg(img_path):
+    """
+    Args:
+        img_path (str): the full path to the image
+
+    Returns:
+        bool: True if the path is an svg file
+    """
+    return img_path.lower().endswith(".svg")
+
+
+class _PooledRenderer(object):
+    """
+    a pooled QSvgRenderer with the lock to hold while rendering with it
+
+    Args:
+        renderer (QtSvg.QSvgRenderer): the parsed svg
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.lock = threading.Lock()
+        self.released = False
+
+    def release(self):
+        """
+        delete the renderer on the thread it belongs to once no thread is rendering with it
+        """
+        with self.lock:
+            self.released = True
+            self.renderer.deleteLater()
+
+
+class SvgRasterCache(object):
+    """
+    a shared pool of svg renderers and a cache of their rasters
+
+    both caches are least recently used and bounded and can be used from the thumbnail thread pool.
+    ``lock`` only guards the dictionaries, parsing and rasterizing happen outside it. each renderer has
+    its own lock because QSvgRenderer must not render from two threads at once, different svgs still
+    render in parallel
+
+    renderers are moved to the main thread once parsed, so they outlive the pool thread that made them
+    and released renderers are deleted by the main thread's event loop
+
+    Class Attributes:
+        max_renderers (int): the number of parsed svg documents to keep
+        max_rasters (int): the number of rendered images to keep
+
+    Examples:
+        image, natural_size = svg_cache.render(":/sphere.svg", 64, 2.0)
+    """
+
+    max_renderers = 256
+    max_rasters = 2048
+
+    def __init__(self):
+        self.renderers = OrderedDict()
+        self.rasters = OrderedDict()
+        self.lock = threading.Lock()
+
+    def renderer(self, img_path):
+        """
+        get the parsed renderer for an svg, parsing it only if it isn't pooled already
+
+        Args:
+            img_path (str): the full path to the svg
+
+        Returns:
+            _PooledRenderer: the renderer for this svg
+        """
+        with self.lock:
+            entry = self.renderers.pop(img_path, None)
+            if entry is not None:
+                self.renderers[img_path] = entry
+                return entry
+
+        renderer = QtSvg.QSvgRenderer(img_path)
+
+        with self.lock:
+            # another thread may have parsed the same svg meanwhile, keep the pooled one
+            pooled = self.renderers.pop(img_path, None)
+            if pooled is not None:
+                self.renderers[img_path] = pooled
+                return pooled
+
+            app = QtCore.QCoreApplication.instance()
+            if app is not None:
+                renderer.moveToThread(app.thread())
+
+            if len(self.renderers) >= self.max_renderers:
+                self.renderers.popitem(last=False)[1].release()
+            entry = _PooledRenderer(renderer)
+            self.renderers[img_path] = entry
+
+        return entry
+
+    def render(self, img_path, max_size, device_pixel_ratio=1.0, cache=True):
+        """
+        rasterize an svg to fit in ``max_size`` logical pixels, larger documents are scaled down
+        and smaller ones keep their natural size
+
+        Args:
+            img_path (str): the full path to the svg
+            max_size (int): the largest logical width or height
+            device_pixel_ratio (float): the device pixel ratio of the screen the image is shown on
+            cache (bool): pass False for one off renders, the svg is parsed on its own and neither
+                the renderer nor the raster is kept
+
+        Returns:
+            tuple[QtGui.QImage, QtCore.QSize]: the raster with its device pixel ratio set, and the svg's natural size
+        """
+        if not cache:
+            return self._rasterize_with(QtSvg.QSvgRenderer(img_path), img_path, max_size, device_pixel_ratio)
+
+        key = (img_path, max_size, device_pixel_ratio)
+
+        with self.lock:
+            cached = self.rasters.pop(key, None)
+            if cached is not None:
+                self.rasters[key] = cached
+                return cached
+
+        cached = self._rasterize(img_path, max_size, device_pixel_ratio)
+
+        with self.lock:
+            if key not in self.rasters and len(self.rasters) >= self.max_rasters:
+                self.rasters.popitem(last=False)
+            self.rasters[key] = cached
+
+        return cached
+
+    def _rasterize(self, img_path, max_size, device_pixel_ratio):
+        while True:
+            entry = self.renderer(img_path)
+            with entry.lock:
+                # the renderer may have been released between fetching it and getting its lock
+                if not entry.released:
+                    return self._rasterize_with(entry.renderer, img_path, max_size, device_pixel_ratio)
+
+    @staticmethod
+    def _rasterize_with(renderer, img_path, max_size, device_pixel_ratio):
+        natural_size = renderer.defaultSize()
+
+        if not renderer.isValid() or natural_size.isEmpty():
+            log.debug("invalid svg: {}".format(img_path))
+            return QtGui.QImage(), natural_size
+
+        target = QtCore.QSize(natural_size)
+        if target.width() > max_size or target.height() > max_size:
+            target.scale(max_size, max_size, QtCore.Qt.KeepAspectRatio)
+
+        image = QtGui.QImage(int(round(target.width() * device_pixel_ratio)),
+                             int(round(target.height() * device_pixel_ratio)),
+                             QtGui.QImage.Format_ARGB32_Premultiplied)
+        # Qt 4 has no device pixel ratio, the ratio is always 1.0 there
+        if hasattr(image, "setDevicePixelRatio"):
+            image.setDevicePixelRatio(device_pixel_ratio)
+        image.fill(QtCore.Qt.transparent)
+
+        # the painter works in logical pixels, the device pixel ratio scales it to the raster
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        renderer.render(painter, QtCore.QRectF(0, 0, target.width(), target.height()))
+        painter.end()
+
+        return image, natural_size
+
+    def trim(self, max_renderers=0, max_rasters=0):
+        """
+        release the least recently used renderers and rasters until each cache is within its limit
+
+        Args:
+            max_renderers (int): the number of parsed svg documents to keep
+            max_rasters (int): the number of rendered images to keep
+        """
+        with self.lock:
+            while len(self.renderers) > max_renderers:
+                self.renderers.popitem(last=False)[1].release()
+            while len(self.rasters) > max_rasters:
+                self.rasters.popitem(last=False)
+
+    def clear(self):
+        """
+        release every pooled renderer and cached raster
+        """
+        with self.lock:
+            for entry in self.renderers.values():
+                entry.release()
+            self.renderers.clear()
+            self.rasters.clear()
+
+
+# shared by every browser window and the thumbnail thread pool
+svg_cache = SvgRasterCache()